@@ -1,52 +1,108 @@
 """Minimal Streamlit dashboard for clinical trial analytics."""
 
+import functools
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import streamlit as st
-import pandas as pd
 import duckdb
-import altair as alt
+
+# pyarrow is loaded by DuckDB on the first Arrow fetch, after the overview
+# metrics have rendered; import it here only for annotations
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 st.set_page_config(page_title="Clinical Trials Dashboard", layout="wide")
 
 DB_PATH = "data/clinical_trials.duckdb"
-SQL_STAGING = Path("sql/staging")
 SQL_ANALYTICS = Path("sql/analytics")
 
-# Consistent color
-CHART_COLOR = "#4C78A8"
+# Read-only analytical workload: use every core, cap memory for the UI process
+DB_CONFIG = {"threads": os.cpu_count() or 1, "memory_limit": "4GB"}
 
-# Clinical trial phase order (domain knowledge)
-PHASE_ORDER = ["PHASE1", "PHASE2", "PHASE3", "PHASE4", "Unknown"]
+# Staging tables materialized by `cli ingest` (see sql/staging/)
+STAGING_TABLES = ["stg_studies", "stg_conditions", "stg_interventions", "stg_locations", "stg_summary"]
 
+# Seconds to keep query results across Streamlit reruns
+QUERY_CACHE_TTL = 600
 
-def normalize_phase(phase: str | None) -> str:
-    """Normalize phase values, treating NA/null as Unknown."""
-    if phase is None or phase == "NA" or phase == "":
-        return "Unknown"
-    return phase
+# Consistent color
+CHART_COLOR = "#4C78A8"
 
 
 @st.cache_resource
 def get_connection():
-    """Get cached database connection."""
+    """Get cached read-only database connection, shared by all sessions."""
     if not Path(DB_PATH).exists():
         st.error(f"Database not found: {DB_PATH}")
         st.info("Run `make ingest` first to load data.")
         st.stop()
-    return duckdb.connect(DB_PATH)
+
+    # Staging is materialized at ingestion time; the dashboard only reads it
+    conn = duckdb.connect(DB_PATH, read_only=True, config=DB_CONFIG)
+    existing = {
+        row[0]
+        for row in conn.execute("SELECT table_name FROM information_schema.tables").fetchall()
+    }
+    missing = [table for table in STAGING_TABLES if table not in existing]
+    if missing:
+        conn.close()
+        st.error(f"Staging tables not found: {', '.join(missing)}")
+        st.info("Run `make ingest` to materialize the staging layer.")
+        st.stop()
+    return conn
+
+
+@functools.lru_cache(maxsize=128)
+def _read_sql(sql_file: Path, mtime: float) -> str:
+    """Read a SQL file once per process; a new `mtime` re-reads it."""
+    return sql_file.read_text()
 
 
-def init_views(conn):
-    """Initialize staging views."""
-    for sql_file in sorted(SQL_STAGING.glob("*.sql")):
-        conn.execute(sql_file.read_text())
+@st.cache_data(ttl=QUERY_CACHE_TTL, show_spinner=False)
+def _cached_query(_conn, sql_file: Path, mtime: float) -> "pa.Table":
+    """Execute a query file; `mtime` is part of the cache key so edits invalidate it."""
+    query = _read_sql(sql_file, mtime)
+    return _conn.execute(query).fetch_arrow_table()
 
 
-def run_query(conn, sql_file: Path) -> pd.DataFrame:
-    """Run an analytics query and return DataFrame."""
-    query = sql_file.read_text()
-    return conn.execute(query).df()
+def run_query(conn, sql_file: Path) -> "pa.Table":
+    """Run an analytics query and return an Arrow table (cached across reruns).
+
+    Arrow tables go straight to `st.vega_lite_chart`; shaping belongs in the
+    SQL file (no pandas round-trip).
+    """
+    return _cached_query(conn, sql_file, sql_file.stat().st_mtime)
+
+
+def bar_spec(x: dict, y: dict, height: int, **properties) -> dict:
+    """Vega-Lite spec for a horizontal bar chart (quantitative x, nominal y).
+
+    Plain dicts go straight to `st.vega_lite_chart`, skipping Altair's
+    object model and `to_dict()` on every rerun.
+    """
+    return {
+        "mark": {"type": "bar", "color": CHART_COLOR},
+        "encoding": {
+            "x": {"type": "quantitative", **x},
+            "y": {"type": "nominal", **y},
+        },
+        "height": height,
+        **properties,
+    }
+
+
+@st.cache_data(ttl=QUERY_CACHE_TTL, show_spinner=False)
+def get_overview_metrics(_conn) -> tuple[int, int, int, int]:
+    """Return (total_studies, completed, total_conditions, total_countries)."""
+    # Precomputed at staging time (sql/staging/005_stg_summary.sql)
+    return _conn.execute(
+        """
+        SELECT total_studies, completed_studies, total_conditions, total_countries
+        FROM stg_summary
+        """
+    ).fetchone()
 
 
 def main():
@@ -54,15 +110,11 @@ def main():
     st.caption("Data sourced from ClinicalTrials.gov API")
 
     conn = get_connection()
-    init_views(conn)
 
     # --- Metrics ---
     st.header("Overview")
 
-    total_studies = conn.execute("SELECT COUNT(*) FROM stg_studies").fetchone()[0]
-    total_conditions = conn.execute("SELECT COUNT(DISTINCT condition_name) FROM stg_conditions").fetchone()[0]
-    total_countries = conn.execute("SELECT COUNT(DISTINCT country) FROM stg_locations").fetchone()[0]
-    completed = conn.execute("SELECT COUNT(*) FROM stg_studies WHERE overall_status = 'COMPLETED'").fetchone()[0]
+    total_studies, completed, total_conditions, total_countries = get_overview_metrics(conn)
 
     col1, col2, col3, col4 = st.columns(4)
     with col1:
@@ -87,45 +139,30 @@ def main():
         st.subheader("Trials by Phase")
         st.caption("Count of studies grouped by reported trial phase")
 
+        # Normalized, grouped and sorted by clinical phase order in SQL
         df_phase = run_query(conn, SQL_ANALYTICS / "trials_by_phase.sql")
-        df_phase["phase"] = df_phase["phase"].apply(normalize_phase)
-        df_phase = df_phase.groupby("phase", as_index=False)["trial_count"].sum()
 
-        # Sort by clinical phase order
-        df_phase["phase_order"] = df_phase["phase"].apply(
-            lambda x: PHASE_ORDER.index(x) if x in PHASE_ORDER else len(PHASE_ORDER)
-        )
-        df_phase = df_phase.sort_values("phase_order")
-
-        chart_phase = (
-            alt.Chart(df_phase)
-            .mark_bar(color=CHART_COLOR)
-            .encode(
-                x=alt.X("trial_count:Q", title="Number of Trials"),
-                y=alt.Y("phase:N", sort=list(df_phase["phase"]), title="Phase"),
-            )
-            .properties(height=300)
+        chart_phase = bar_spec(
+            x={"field": "trial_count", "title": "Number of Trials"},
+            y={"field": "phase", "sort": df_phase.column("phase").to_pylist(), "title": "Phase"},
+            height=300,
         )
-        st.altair_chart(chart_phase, width="stretch")
+        st.vega_lite_chart(df_phase, chart_phase, width="stretch")
         st.caption("*Studies without phase information are grouped as 'Unknown'*")
 
     with col_right:
         st.subheader("Completion Rate by Intervention")
         st.caption("Percentage of completed studies per intervention type")
 
+        # Query is already ordered by completion_rate DESC and limited to 10 rows
         df_interventions = run_query(conn, SQL_ANALYTICS / "interventions_completion_rate.sql")
-        df_interventions = df_interventions.sort_values("completion_rate", ascending=False).head(10)
-
-        chart_interventions = (
-            alt.Chart(df_interventions)
-            .mark_bar(color=CHART_COLOR)
-            .encode(
-                x=alt.X("completion_rate:Q", title="Completion Rate (%)", scale=alt.Scale(domain=[0, 100])),
-                y=alt.Y("intervention_type:N", sort="-x", title="Intervention Type"),
-            )
-            .properties(height=300)
+
+        chart_interventions = bar_spec(
+            x={"field": "completion_rate", "title": "Completion Rate (%)", "scale": {"domain": [0, 100]}},
+            y={"field": "intervention_type", "sort": "-x", "title": "Intervention Type"},
+            height=300,
         )
-        st.altair_chart(chart_interventions, width="stretch")
+        st.vega_lite_chart(df_interventions, chart_interventions, width="stretch")
 
     st.divider()
 
@@ -138,35 +175,27 @@ def main():
         st.subheader("Top 10 Conditions")
         st.caption("Most frequently studied conditions across all trials")
 
-        df_conditions = run_query(conn, SQL_ANALYTICS / "top_conditions.sql").head(10)
+        df_conditions = run_query(conn, SQL_ANALYTICS / "top_conditions.sql")
 
-        chart_conditions = (
-            alt.Chart(df_conditions)
-            .mark_bar(color=CHART_COLOR)
-            .encode(
-                x=alt.X("trial_count:Q", title="Number of Trials"),
-                y=alt.Y("condition_name:N", sort="-x", title=None, axis=alt.Axis(labelLimit=300)),
-            )
-            .properties(height=350)
+        chart_conditions = bar_spec(
+            x={"field": "trial_count", "title": "Number of Trials"},
+            y={"field": "condition_name", "sort": "-x", "title": None, "axis": {"labelLimit": 300}},
+            height=350,
         )
-        st.altair_chart(chart_conditions, width="stretch")
+        st.vega_lite_chart(df_conditions, chart_conditions, width="stretch")
 
     with col_right2:
         st.subheader("Top 10 Countries")
         st.caption("Countries with the highest number of trial locations")
 
-        df_country = run_query(conn, SQL_ANALYTICS / "trials_by_country.sql").head(10)
+        df_country = run_query(conn, SQL_ANALYTICS / "trials_by_country.sql")
 
-        chart_country = (
-            alt.Chart(df_country)
-            .mark_bar(color=CHART_COLOR)
-            .encode(
-                x=alt.X("trial_count:Q", title="Number of Trials"),
-                y=alt.Y("country:N", sort="-x", title=None),
-            )
-            .properties(height=350)
+        chart_country = bar_spec(
+            x={"field": "trial_count", "title": "Number of Trials"},
+            y={"field": "country", "sort": "-x", "title": None},
+            height=350,
         )
-        st.altair_chart(chart_country, width="stretch")
+        st.vega_lite_chart(df_country, chart_country, width="stretch")
 
     st.divider()
 
@@ -174,24 +203,17 @@ def main():
     st.header("Study Duration")
     st.caption("Average duration in months from start to primary completion date")
 
+    # Labels, phase normalization and the top-10 cut are all done in SQL
     df_duration = run_query(conn, SQL_ANALYTICS / "study_duration.sql")
-    df_duration = df_duration[df_duration["avg_duration_months"].notna()]
-    df_duration["phase"] = df_duration["phase"].apply(normalize_phase)
-    df_duration = df_duration.sort_values("avg_duration_months", ascending=False).head(10)
-
-    if not df_duration.empty:
-        df_duration["label"] = df_duration["study_type"] + " / " + df_duration["phase"]
-
-        chart_duration = (
-            alt.Chart(df_duration)
-            .mark_bar(color=CHART_COLOR)
-            .encode(
-                x=alt.X("avg_duration_months:Q", title="Average Duration (months)"),
-                y=alt.Y("label:N", sort="-x", title=None),
-            )
-            .properties(height=300, padding={"bottom": 20})
+
+    if df_duration.num_rows > 0:
+        chart_duration = bar_spec(
+            x={"field": "avg_duration_months", "title": "Average Duration (months)"},
+            y={"field": "label", "sort": "-x", "title": None},
+            height=300,
+            padding={"bottom": 20},
         )
-        st.altair_chart(chart_duration, width="stretch")
+        st.vega_lite_chart(df_duration, chart_duration, width="stretch")
     else:
         st.info("No duration data available.")
 
@@ -1,30 +1,33 @@
 -- Study duration analysis
 -- Answers: Timeline analysis of study durations?
+-- Studies without phase information (NULL, empty or 'NA') are grouped as 'Unknown',
+-- as are studies without a study type
 
+WITH durations AS (
+    SELECT
+        COALESCE(study_type, 'Unknown') AS study_type,
+        CASE
+            WHEN phase IS NULL OR phase IN ('NA', '') THEN 'Unknown'
+            ELSE phase
+        END AS phase,
+        DATEDIFF('month',
+            TRY_CAST(start_date AS DATE),
+            TRY_CAST(completion_date AS DATE)
+        ) AS duration_months
+    FROM stg_studies
+    WHERE start_date IS NOT NULL
+      AND completion_date IS NOT NULL
+)
 SELECT
     study_type,
     phase,
+    study_type || ' / ' || phase AS label,
     COUNT(*) AS trial_count,
-    ROUND(AVG(
-        DATEDIFF('month',
-            TRY_CAST(start_date AS DATE),
-            TRY_CAST(completion_date AS DATE)
-        )
-    ), 1) AS avg_duration_months,
-    MIN(
-        DATEDIFF('month',
-            TRY_CAST(start_date AS DATE),
-            TRY_CAST(completion_date AS DATE)
-        )
-    ) AS min_duration_months,
-    MAX(
-        DATEDIFF('month',
-            TRY_CAST(start_date AS DATE),
-            TRY_CAST(completion_date AS DATE)
-        )
-    ) AS max_duration_months
-FROM stg_studies
-WHERE start_date IS NOT NULL
-  AND completion_date IS NOT NULL
+    ROUND(AVG(duration_months), 1) AS avg_duration_months,
+    MIN(duration_months) AS min_duration_months,
+    MAX(duration_months) AS max_duration_months
+FROM durations
 GROUP BY study_type, phase
-ORDER BY avg_duration_months DESC NULLS LAST;
+HAVING AVG(duration_months) IS NOT NULL
+ORDER BY avg_duration_months DESC, study_type, phase
+LIMIT 10;
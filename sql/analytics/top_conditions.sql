@@ -6,5 +6,5 @@ SELECT
     COUNT(DISTINCT nct_id) AS trial_count
 FROM stg_conditions
 GROUP BY condition_name
-ORDER BY trial_count DESC
-LIMIT 20;
+ORDER BY trial_count DESC, condition_name
+LIMIT 10;
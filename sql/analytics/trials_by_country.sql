@@ -9,5 +9,5 @@ SELECT
 FROM stg_locations
 WHERE country IS NOT NULL
 GROUP BY country
-ORDER BY trial_count DESC
-LIMIT 20;
+ORDER BY trial_count DESC, country
+LIMIT 10;
@@ -1,11 +1,28 @@
--- Trials by study type and phase
--- Answers: How many trials by study type and phase?
+-- Trials by phase
+-- Answers: How many trials are in each clinical phase?
+-- Studies without phase information (NULL, empty or 'NA') are grouped as 'Unknown'
 
+WITH phased AS (
+    SELECT
+        CASE
+            WHEN phase IS NULL OR phase IN ('NA', '') THEN 'Unknown'
+            ELSE phase
+        END AS phase
+    FROM stg_studies
+)
 SELECT
-    study_type,
     phase,
     COUNT(*) AS trial_count,
-    ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (), 2) AS pct_of_total
-FROM stg_studies
-GROUP BY study_type, phase
-ORDER BY trial_count DESC;
+    ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (), 2) AS pct_of_total,
+    -- Clinical phase order (domain knowledge); other values sort last
+    CASE phase
+        WHEN 'PHASE1' THEN 0
+        WHEN 'PHASE2' THEN 1
+        WHEN 'PHASE3' THEN 2
+        WHEN 'PHASE4' THEN 3
+        WHEN 'Unknown' THEN 4
+        ELSE 5
+    END AS phase_order
+FROM phased
+GROUP BY phase
+ORDER BY phase_order, phase;
@@ -1,7 +1,7 @@
--- Staging view for studies (Silver layer)
+-- Staging table for studies (Silver layer)
 -- Extracts core fields from raw JSON into a normalized structure
 
-CREATE OR REPLACE VIEW stg_studies AS
+CREATE OR REPLACE TABLE stg_studies AS
 SELECT
     raw_json->>'$.protocolSection.identificationModule.nctId' AS nct_id,
     raw_json->>'$.protocolSection.identificationModule.briefTitle' AS brief_title,
@@ -1,7 +1,7 @@
--- Staging view for conditions (Silver layer)
+-- Staging table for conditions (Silver layer)
 -- Unnests conditions array from raw JSON (1:N with studies)
 
-CREATE OR REPLACE VIEW stg_conditions AS
+CREATE OR REPLACE TABLE stg_conditions AS
 SELECT
     raw_json->>'$.protocolSection.identificationModule.nctId' AS nct_id,
     unnest(from_json(
@@ -1,7 +1,7 @@
--- Staging view for interventions (Silver layer)
+-- Staging table for interventions (Silver layer)
 -- Unnests interventions array from raw JSON (1:N with studies)
 
-CREATE OR REPLACE VIEW stg_interventions AS
+CREATE OR REPLACE TABLE stg_interventions AS
 SELECT
     raw_json->>'$.protocolSection.identificationModule.nctId' AS nct_id,
     intervention->>'type' AS intervention_type,
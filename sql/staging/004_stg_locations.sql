@@ -1,7 +1,7 @@
--- Staging view for locations (Silver layer)
+-- Staging table for locations (Silver layer)
 -- Unnests locations array from raw JSON (1:N with studies)
 
-CREATE OR REPLACE VIEW stg_locations AS
+CREATE OR REPLACE TABLE stg_locations AS
 SELECT
     raw_json->>'$.protocolSection.identificationModule.nctId' AS nct_id,
     location->>'$.facility' AS facility,
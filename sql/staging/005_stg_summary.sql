@@ -0,0 +1,17 @@
+-- Staging table for dashboard overview metrics (Silver layer)
+-- Single row of totals precomputed from the other staging tables (applied last)
+
+CREATE OR REPLACE TABLE stg_summary AS
+SELECT
+    s.total_studies,
+    s.completed_studies,
+    c.total_conditions,
+    l.total_countries
+FROM (
+    SELECT
+        COUNT(*) AS total_studies,
+        COUNT(*) FILTER (WHERE overall_status = 'COMPLETED') AS completed_studies
+    FROM stg_studies
+) s
+CROSS JOIN (SELECT COUNT(DISTINCT condition_name) AS total_conditions FROM stg_conditions) c
+CROSS JOIN (SELECT COUNT(DISTINCT country) AS total_countries FROM stg_locations) l;
@@ -2,9 +2,24 @@
 
 import argparse
 import sys
+from pathlib import Path
 
-from clinical_trial_pipeline.common.logging import setup_logging
+from clinical_trial_pipeline.common.logging import get_logger, setup_logging
+from clinical_trial_pipeline.extract.clinicaltrials_client import MAX_PAGE_SIZE, APIConfig
 from clinical_trial_pipeline.load.ingestion import IngestService
+from clinical_trial_pipeline.storage.database import Database
+from clinical_trial_pipeline.transform.analytics import ANALYTICS_SQL_DIR, validate_analytics
+from clinical_trial_pipeline.transform.staging import STAGING_SQL_DIR, apply_staging
+
+logger = get_logger(__name__)
+
+
+def page_size(value: str) -> int:
+    """argparse type for --page-size; the range check is APIConfig's."""
+    try:
+        return APIConfig(page_size=int(value)).page_size
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
 
 
 def cmd_ingest(args: argparse.Namespace) -> int:
@@ -14,19 +29,64 @@ def cmd_ingest(args: argparse.Namespace) -> int:
     service = IngestService(
         db_path=args.db_path,
         page_size=args.page_size,
+        parquet_dir=args.parquet_dir,
     )
 
-    result = service.run(max_studies=args.max_studies)
+    # One connection for ingestion and the staging refresh
+    with Database(args.db_path) as db:
+        result = service.run(max_studies=args.max_studies, database=db)
 
-    print(f"\nIngestion complete:")
-    print(f"  Inserted: {result.inserted}")
-    print(f"  Skipped:  {result.skipped}")
-    print(f"  Pages:    {result.pages}")
-    print(f"  Errors:   {len(result.errors)}")
+        print(f"\nIngestion complete:")
+        print(f"  Inserted: {result.inserted}")
+        print(f"  Skipped:  {result.skipped}")
+        print(f"  Pages:    {result.pages}")
+        print(f"  Errors:   {len(result.errors)}")
+        if result.parquet_path:
+            print(f"  Parquet:  {result.parquet_path}")
+
+        # Rebuild staging tables so they reflect the newly ingested raw rows
+        if not args.skip_staging:
+            applied = apply_staging(db)
+            print(f"  Staging:  {len(applied)} tables refreshed")
 
     return 1 if result.errors else 0
 
 
+def cmd_stage(args: argparse.Namespace) -> int:
+    """Run staging command."""
+    setup_logging()
+
+    with Database(args.db_path) as db:
+        applied = apply_staging(db, sql_dir=Path(args.sql_dir))
+
+    for name in applied:
+        print(f"Applied {name}")
+    print(f"\nStaging complete: {len(applied)} tables materialized")
+
+    return 0
+
+
+def cmd_validate(args: argparse.Namespace) -> int:
+    """Run analytics validation command."""
+    setup_logging()
+
+    # Opening a missing file would fail (read-only) with a raw IOException
+    if not Path(args.db_path).exists():
+        logger.error("Database not found: %s (run `ingest` first)", args.db_path)
+        return 1
+
+    with Database(args.db_path, read_only=True) as db:
+        row_counts = validate_analytics(db, sql_dir=Path(args.sql_dir))
+
+    for name, row_count in row_counts.items():
+        print(f"{name}: {row_count} rows")
+        if row_count == 0:
+            print("  WARNING: No data returned")
+    print("\nAnalytics validation completed")
+
+    return 0
+
+
 def main() -> int:
     """CLI entrypoint."""
     parser = argparse.ArgumentParser(
@@ -50,12 +110,50 @@ def main() -> int:
     )
     ingest_parser.add_argument(
         "--page-size",
-        type=int,
-        default=100,
-        help="Number of studies per API request (default: 100)",
+        type=page_size,
+        default=MAX_PAGE_SIZE,
+        help=f"Number of studies per API request (default and API maximum: {MAX_PAGE_SIZE})",
+    )
+    ingest_parser.add_argument(
+        "--parquet-dir",
+        default=None,
+        help="Also write newly inserted raw studies to Parquet under this directory",
+    )
+    ingest_parser.add_argument(
+        "--skip-staging",
+        action="store_true",
+        help="Do not refresh staging tables after ingestion",
     )
     ingest_parser.set_defaults(func=cmd_ingest)
 
+    # stage command
+    stage_parser = subparsers.add_parser("stage", help="Materialize staging tables")
+    stage_parser.add_argument(
+        "--db-path",
+        default="data/clinical_trials.duckdb",
+        help="Path to DuckDB database (default: data/clinical_trials.duckdb)",
+    )
+    stage_parser.add_argument(
+        "--sql-dir",
+        default=str(STAGING_SQL_DIR),
+        help="Directory with staging SQL files (default: sql/staging)",
+    )
+    stage_parser.set_defaults(func=cmd_stage)
+
+    # validate command
+    validate_parser = subparsers.add_parser("validate", help="Validate analytics queries")
+    validate_parser.add_argument(
+        "--db-path",
+        default="data/clinical_trials.duckdb",
+        help="Path to DuckDB database (default: data/clinical_trials.duckdb)",
+    )
+    validate_parser.add_argument(
+        "--sql-dir",
+        default=str(ANALYTICS_SQL_DIR),
+        help="Directory with analytics SQL files (default: sql/analytics)",
+    )
+    validate_parser.set_defaults(func=cmd_validate)
+
     args = parser.parse_args()
     return args.func(args)
 
@@ -2,11 +2,13 @@
 
 import logging
 import sys
+import threading
 
 DEFAULT_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 DEFAULT_LEVEL = logging.INFO
 
 _configured = False
+_lock = threading.Lock()
 
 
 def setup_logging(level: int = DEFAULT_LEVEL, format_string: str = DEFAULT_FORMAT) -> None:
@@ -18,17 +20,24 @@ def setup_logging(level: int = DEFAULT_LEVEL, format_string: str = DEFAULT_FORMA
     """
     global _configured
 
-    if _configured:
-        return
+    # Airflow workers and Streamlit sessions may call this from several threads
+    with _lock:
+        if _configured:
+            return
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(logging.Formatter(format_string))
+        root_logger = logging.getLogger("clinical_trial_pipeline")
+        root_logger.setLevel(level)
 
-    root_logger = logging.getLogger("clinical_trial_pipeline")
-    root_logger.setLevel(level)
-    root_logger.addHandler(handler)
+        # A re-imported module starts with _configured=False but the logger keeps its handlers
+        if not any(
+            isinstance(h, logging.StreamHandler) and h.stream is sys.stdout
+            for h in root_logger.handlers
+        ):
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter(format_string))
+            root_logger.addHandler(handler)
 
-    _configured = True
+        _configured = True
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -3,12 +3,29 @@
 from dataclasses import dataclass
 from typing import Any
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
 
 from clinical_trial_pipeline.common.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Largest pageSize the API v2 accepts
+MAX_PAGE_SIZE = 1000
+
+# Rate limiting and transient server errors worth retrying
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Retries for a page whose response does not arrive within the timeout
+READ_RETRIES = 1
+
+# Upper bounds (seconds) on a single backoff sleep and on an honoured Retry-After
+MAX_BACKOFF = 30
+MAX_RETRY_AFTER = 60
+
 
 @dataclass
 class APIConfig:
@@ -16,7 +33,13 @@ class APIConfig:
 
     base_url: str = "https://clinicaltrials.gov/api/v2"
     timeout: int = 30
-    page_size: int = 100
+    page_size: int = MAX_PAGE_SIZE
+    max_retries: int = 3
+    backoff_factor: float = 1.0
+
+    def __post_init__(self):
+        if not 1 <= self.page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}, got {self.page_size}")
 
 
 class ClinicalTrialsAPIError(Exception):
@@ -30,8 +53,31 @@ class ClinicalTrialsClient:
 
     def __init__(self, config: APIConfig | None = None):
         self.config = config or APIConfig()
+        # One session per client: its connection pool keeps the TLS connection
+        # alive across pages (requests sends keep-alive by default).
+        # requests advertises and decodes gzip by default, and br once the
+        # brotli package is installed; response.content is already decoded.
         self._session = requests.Session()
 
+        # Pages are chained by nextPageToken, so requests cannot be fanned out;
+        # instead each one is retried with capped exponential backoff, honouring
+        # Retry-After on 429/503 up to MAX_RETRY_AFTER. A read timeout is retried
+        # READ_RETRIES times, so one slow page does not end the run while a
+        # server that stops responding costs at most (READ_RETRIES + 1) timeouts.
+        # The last failed response is returned so raise_for_status() reports its status.
+        retry = Retry(
+            total=self.config.max_retries,
+            read=READ_RETRIES,
+            backoff_factor=self.config.backoff_factor,
+            backoff_max=MAX_BACKOFF,
+            retry_after_max=MAX_RETRY_AFTER,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        self._session.mount("https://", HTTPAdapter(max_retries=retry))
+        self._session.mount("http://", HTTPAdapter(max_retries=retry))
+
     def fetch_studies(
         self,
         page_token: str | None = None,
@@ -59,6 +105,12 @@ class ClinicalTrialsClient:
                 f"Request timed out after {self.config.timeout}s"
             ) from e
         except requests.exceptions.ConnectionError as e:
+            # Read timeouts that exhaust READ_RETRIES arrive wrapped in MaxRetryError
+            reason = getattr(e.args[0], "reason", None) if e.args else None
+            if isinstance(reason, ReadTimeoutError):
+                raise ClinicalTrialsAPIError(
+                    f"Request timed out after {self.config.timeout}s"
+                ) from e
             raise ClinicalTrialsAPIError(
                 f"Failed to connect to {self.config.base_url}"
             ) from e
@@ -67,7 +119,11 @@ class ClinicalTrialsClient:
                 f"API returned status {e.response.status_code}: {e.response.text[:200]}"
             ) from e
 
-        data = response.json()
+        # orjson parses the raw bytes directly, skipping charset detection and str decoding
+        try:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise ClinicalTrialsAPIError(f"API returned invalid JSON: {e}") from e
         study_count = len(data.get("studies", []))
         logger.info("Fetched %d studies", study_count)
 
@@ -1,10 +1,16 @@
 """Ingestion service for loading raw clinical trial data."""
 
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 
 from clinical_trial_pipeline.common.logging import get_logger
 from clinical_trial_pipeline.extract.clinicaltrials_client import (
+    MAX_PAGE_SIZE,
+    APIConfig,
     ClinicalTrialsClient,
     ClinicalTrialsAPIError,
 )
@@ -22,6 +28,7 @@ class IngestResult:
     skipped: int = 0
     pages: int = 0
     errors: list[str] = field(default_factory=list)
+    parquet_path: Path | None = None
 
     @property
     def total_processed(self) -> int:
@@ -40,63 +47,65 @@ class IngestService:
     def __init__(
         self,
         db_path: Path | str = "data/clinical_trials.duckdb",
-        page_size: int = 100,
+        page_size: int = MAX_PAGE_SIZE,
+        parquet_dir: Path | str | None = None,
     ):
         """Initialize ingestion service.
 
         Args:
             db_path: Path to DuckDB database file
-            page_size: Number of studies per API request
+            page_size: Number of studies per API request (at most MAX_PAGE_SIZE)
+            parquet_dir: If set, also write each run's new raw records to Parquet here
+
+        Raises:
+            ValueError: If page_size is outside the API limits
         """
         self.db_path = db_path
-        self.page_size = page_size
+        self.api_config = APIConfig(page_size=page_size)
+        self.page_size = self.api_config.page_size
+        self.parquet_dir = Path(parquet_dir) if parquet_dir is not None else None
 
     def run(
         self,
         max_studies: int | None = None,
         max_pages: int | None = None,
+        database: Database | None = None,
     ) -> IngestResult:
         """Run ingestion process.
 
         Args:
             max_studies: Maximum number of studies to ingest (None for unlimited)
             max_pages: Maximum number of API pages to fetch (None for unlimited)
+            database: Open database to write to (left open); by default
+                db_path is opened and closed for this run
 
         Returns:
             IngestResult with counts and any errors
         """
         result = IngestResult()
 
-        with Database(self.db_path) as db:
+        with nullcontext(database) if database is not None else Database(self.db_path) as db:
             repo = RawStudyRepository(db)
             repo.initialize()
-
-            with ClinicalTrialsClient() as client:
-                page_token = None
-
-                while True:
-                    # Check page limit
-                    if max_pages is not None and result.pages >= max_pages:
-                        logger.info("Reached max pages limit: %d", max_pages)
-                        break
-
-                    # Check study limit
-                    if max_studies is not None and result.total_processed >= max_studies:
-                        logger.info("Reached max studies limit: %d", max_studies)
-                        break
-
-                    # Calculate page size for this request
-                    request_page_size = self.page_size
-                    if max_studies is not None:
-                        remaining = max_studies - result.total_processed
-                        request_page_size = min(self.page_size, remaining)
-
-                    # Fetch page
+            last_id = repo.max_id() if self.parquet_dir is not None else 0
+
+            # A single background worker fetches page N+1 while page N is written
+            # to DuckDB, overlapping network latency with inserts.
+            with ClinicalTrialsClient(self.api_config) as client, ThreadPoolExecutor(max_workers=1) as executor:
+                pages_fetched = 0
+                studies_fetched = 0
+
+                page_size = self._next_page_size(pages_fetched, studies_fetched, max_studies, max_pages)
+                future = (
+                    executor.submit(client.fetch_studies, page_token=None, page_size=page_size)
+                    if page_size is not None
+                    else None
+                )
+
+                while future is not None:
+                    # Wait for the in-flight page
                     try:
-                        data = client.fetch_studies(
-                            page_token=page_token,
-                            page_size=request_page_size,
-                        )
+                        data = future.result()
                     except ClinicalTrialsAPIError as e:
                         error_msg = f"API error on page {result.pages + 1}: {e}"
                         logger.error(error_msg)
@@ -108,6 +117,25 @@ class IngestService:
                         logger.info("No more studies to fetch")
                         break
 
+                    pages_fetched += 1
+                    studies_fetched += len(studies)
+
+                    # Prefetch next page before inserting this one
+                    future = None
+                    page_token = data.get("nextPageToken")
+                    if not page_token:
+                        logger.info("No more pages available")
+                    else:
+                        page_size = self._next_page_size(
+                            pages_fetched, studies_fetched, max_studies, max_pages
+                        )
+                        if page_size is not None:
+                            future = executor.submit(
+                                client.fetch_studies,
+                                page_token=page_token,
+                                page_size=page_size,
+                            )
+
                     # Insert into raw storage
                     inserted, skipped = repo.insert_studies_batch(studies)
                     result.inserted += inserted
@@ -122,11 +150,43 @@ class IngestService:
                         result.total_processed,
                     )
 
-                    # Check for next page
-                    page_token = data.get("nextPageToken")
-                    if not page_token:
-                        logger.info("No more pages available")
-                        break
+            # Rows inserted by this run have ids above the pre-run watermark
+            if self.parquet_dir is not None and result.inserted:
+                result.parquet_path = self._parquet_path(datetime.now())
+                repo.export_parquet(result.parquet_path, after_id=last_id)
 
         logger.info("Ingestion complete: %s", result)
         return result
+
+    def _parquet_path(self, timestamp: datetime) -> Path:
+        """Hive-style partitioned file for one run's raw export.
+
+        The random suffix keeps runs finishing in the same second from
+        overwriting each other's export.
+        """
+        name = f"part-{timestamp:%H%M%S}-{uuid.uuid4().hex[:8]}.parquet"
+        return self.parquet_dir / f"ingest_date={timestamp:%Y%m%d}" / name
+
+    def _next_page_size(
+        self,
+        pages_fetched: int,
+        studies_fetched: int,
+        max_studies: int | None,
+        max_pages: int | None,
+    ) -> int | None:
+        """Page size for the next request, or None if a limit has been reached."""
+        # Check page limit
+        if max_pages is not None and pages_fetched >= max_pages:
+            logger.info("Reached max pages limit: %d", max_pages)
+            return None
+
+        # Check study limit
+        if max_studies is None:
+            return self.page_size
+
+        remaining = max_studies - studies_fetched
+        if remaining <= 0:
+            logger.info("Reached max studies limit: %d", max_studies)
+            return None
+
+        return min(self.page_size, remaining)
@@ -1,6 +1,8 @@
 """DuckDB database connection management."""
 
+import os
 from pathlib import Path
+from typing import Any
 
 import duckdb
 
@@ -10,21 +12,47 @@ logger = get_logger(__name__)
 
 DEFAULT_DB_PATH = Path("data/clinical_trials.duckdb")
 
+# DuckDB may write bulk inserts and CREATE TABLE AS results in parallel
+# without keeping their order: stg_* tables have no defined row order, so
+# readers must not rely on it (every sql/analytics query has an ORDER BY)
+DEFAULT_CONFIG: dict[str, Any] = {"preserve_insertion_order": False}
+
+# Environment variables that override DuckDB settings (unset: DuckDB default)
+ENV_SETTINGS = {
+    "DUCKDB_THREADS": "threads",
+    "DUCKDB_MEMORY_LIMIT": "memory_limit",
+    "DUCKDB_TEMP_DIRECTORY": "temp_directory",
+}
+
+
+def _config_from_env() -> dict[str, str]:
+    """DuckDB settings taken from DUCKDB_* environment variables."""
+    return {setting: os.environ[var] for var, setting in ENV_SETTINGS.items() if os.environ.get(var)}
+
 
 class Database:
     """DuckDB database connection manager."""
 
-    def __init__(self, db_path: Path | str | None = None):
+    def __init__(
+        self,
+        db_path: Path | str | None = None,
+        read_only: bool = False,
+        config: dict[str, Any] | None = None,
+    ):
         """Initialize database connection.
 
         Args:
             db_path: Path to DuckDB file. If None, uses default path.
                      Use ":memory:" for in-memory database.
+            read_only: Open the database file in read-only mode
+            config: DuckDB settings, applied over DEFAULT_CONFIG and DUCKDB_* env vars
         """
         if db_path is None:
             db_path = DEFAULT_DB_PATH
 
         self.db_path = Path(db_path) if db_path != ":memory:" else db_path
+        self.read_only = read_only
+        self.config = {**DEFAULT_CONFIG, **_config_from_env(), **(config or {})}
         self._connection: duckdb.DuckDBPyConnection | None = None
 
     def connect(self) -> duckdb.DuckDBPyConnection:
@@ -32,10 +60,12 @@ class Database:
         if self._connection is not None:
             return self._connection
 
-        if self.db_path != ":memory:":
+        if self.db_path != ":memory:" and not self.read_only:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._connection = duckdb.connect(str(self.db_path))
+        self._connection = duckdb.connect(
+            str(self.db_path), read_only=self.read_only, config=self.config
+        )
         logger.info("Connected to database: %s", self.db_path)
         return self._connection
 
@@ -1,11 +1,16 @@
 """Repository for raw studies storage."""
 
+import codecs
+import functools
 import hashlib
 import json
+import re
+from collections.abc import Sequence
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
 from typing import Any
 
-import duckdb
+import orjson
 
 from clinical_trial_pipeline.common.logging import get_logger
 from clinical_trial_pipeline.storage.database import Database
@@ -16,10 +21,81 @@ DDL_PATH = Path(__file__).parent.parent.parent.parent / "sql" / "raw" / "001_cre
 DEFAULT_SOURCE = "clinicaltrials_api_v2"
 
 
+# Small floats that json.dumps writes differently from orjson ("1e-05" vs
+# "0.00001", "1e-09" vs "1e-9"). The pattern starts with a literal so the scan
+# stays fast; candidates are then checked for the digit orjson always writes
+# before the exponent, so hyphenated words ("Phase-2", "Type-2") do not match.
+_NEGATIVE_EXPONENT = re.compile(rb"e-\d")
+_DIGITS = frozenset(b"0123456789")
+
+
+def _escape_non_ascii(error: UnicodeEncodeError) -> tuple[str, int]:
+    """Codec error handler writing non-ASCII characters as JSON \\uXXXX escapes."""
+    # A run of non-ASCII characters holds no quotes or backslashes, so json's
+    # C string escaper (minus the surrounding quotes) is exactly json.dumps' output
+    escaped = encode_basestring_ascii(error.object[error.start:error.end])
+    return escaped[1:-1], error.end
+
+
+@functools.cache
+def _escape_errors() -> str:
+    """Name of the non-ASCII escape handler, registered with codecs on first use."""
+    name = "clinical_trial_pipeline.json_escape_non_ascii"
+    codecs.register_error(name, _escape_non_ascii)
+    return name
+
+
+def _has_negative_exponent(encoded: bytes) -> bool:
+    """Whether orjson output holds a float with a negative exponent."""
+    return any(
+        match.start() and encoded[match.start() - 1] in _DIGITS
+        for match in _NEGATIVE_EXPONENT.finditer(encoded)
+    )
+
+
+def canonical_json(data: dict[str, Any]) -> str:
+    """Serialize to the compact, key-sorted, ASCII-only JSON used for content hashes.
+
+    Identical to json.dumps(data, sort_keys=True, separators=(",", ":")),
+    which existing content hashes were computed with, but serialized with
+    orjson; payloads orjson cannot reproduce exactly fall back to json.dumps.
+    """
+    try:
+        encoded = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    except orjson.JSONEncodeError:
+        encoded = None
+
+    # orjson writes NaN and +/-Infinity as null where json.dumps writes
+    # NaN/Infinity, so any null takes the json.dumps path (API responses hold
+    # neither: orjson.loads rejects non-finite numbers and empty fields are omitted)
+    if (
+        encoded is None
+        or b"0.0000" in encoded
+        or b"null" in encoded
+        or _has_negative_exponent(encoded)
+    ):
+        return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+    if encoded.isascii():
+        content = encoded.decode("ascii")
+    else:
+        content = encoded.decode().encode("ascii", _escape_errors()).decode("ascii")
+    return content.replace("\x7f", "\\u007f")
+
+
+@functools.cache
+def _raw_ddl() -> str:
+    """Raw layer DDL, read once per process."""
+    return DDL_PATH.read_text()
+
+
+def _sha256_hex(content: str) -> str:
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
 def compute_content_hash(data: dict[str, Any]) -> str:
     """Compute SHA-256 hash of JSON content."""
-    content = json.dumps(data, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(content.encode()).hexdigest()
+    return _sha256_hex(canonical_json(data))
 
 
 class RawStudyRepository:
@@ -34,8 +110,8 @@ class RawStudyRepository:
         if self._initialized:
             return
 
-        ddl = DDL_PATH.read_text()
-        self.db.connection.execute(ddl)
+        # Idempotent (IF NOT EXISTS), so every new repository can run it
+        self.db.connection.execute(_raw_ddl())
         self._initialized = True
         logger.info("Raw studies table initialized")
 
@@ -55,28 +131,22 @@ class RawStudyRepository:
         Returns:
             True if inserted, False if duplicate (same content_hash)
         """
-        content_hash = compute_content_hash(raw_json)
-
-        try:
-            self.db.connection.execute(
-                """
-                INSERT INTO raw_studies (nct_id, source, raw_json, content_hash)
-                VALUES (?, ?, ?, ?)
-                """,
-                [nct_id, source, json.dumps(raw_json), content_hash],
-            )
+        payload = canonical_json(raw_json)
+        content_hash = _sha256_hex(payload)
+        inserted = self._insert_rows([nct_id], [payload], [content_hash], source)
+
+        if inserted:
             logger.debug("Inserted study %s", nct_id)
-            return True
-        except duckdb.ConstraintException:
+        else:
             logger.debug("Skipped duplicate study %s (hash: %s...)", nct_id, content_hash[:8])
-            return False
+        return inserted == 1
 
     def insert_studies_batch(
         self,
         studies: list[dict[str, Any]],
         source: str = DEFAULT_SOURCE,
     ) -> tuple[int, int]:
-        """Insert multiple studies.
+        """Insert multiple studies with a single set-based INSERT.
 
         Args:
             studies: List of raw study payloads
@@ -85,57 +155,159 @@ class RawStudyRepository:
         Returns:
             Tuple of (inserted_count, skipped_count)
         """
-        inserted = 0
-        skipped = 0
+        if not studies:
+            return 0, 0
+
+        nct_ids = []
+        payloads = []
+        hashes = []
+        batch_hashes = set()
 
         for study in studies:
             nct_id = study.get("protocolSection", {}).get("identificationModule", {}).get("nctId")
             if nct_id is None:
                 logger.warning("Study missing nctId, skipping")
-                skipped += 1
                 continue
 
-            if self.insert_study(nct_id, study, source):
-                inserted += 1
-            else:
-                skipped += 1
+            # Stored JSON is the hashed text, so each study is serialized once
+            payload = canonical_json(study)
+            content_hash = _sha256_hex(payload)
+
+            # Same content twice in one page is a duplicate too
+            if content_hash in batch_hashes:
+                continue
+            batch_hashes.add(content_hash)
+
+            nct_ids.append(nct_id)
+            payloads.append(payload)
+            hashes.append(content_hash)
+
+        inserted = self._insert_rows(nct_ids, payloads, hashes, source)
+        skipped = len(studies) - inserted
 
         logger.info("Batch insert complete: %d inserted, %d skipped", inserted, skipped)
         return inserted, skipped
 
+    def _insert_rows(
+        self,
+        nct_ids: list[str],
+        payloads: list[str],
+        hashes: list[str],
+        source: str,
+    ) -> int:
+        """Insert rows whose content_hash is not stored yet.
+
+        The columns are bound as lists and unnested by DuckDB, so a whole
+        page is written by one statement instead of one INSERT per study.
+
+        Returns:
+            Number of inserted rows
+        """
+        if not nct_ids:
+            return 0
+
+        result = self.db.connection.execute(
+            """
+            INSERT INTO raw_studies (nct_id, source, raw_json, content_hash)
+            SELECT batch.nct_id, ?, batch.raw_json, batch.content_hash
+            FROM (
+                SELECT
+                    unnest(?::VARCHAR[]) AS nct_id,
+                    unnest(?::VARCHAR[]) AS raw_json,
+                    unnest(?::VARCHAR[]) AS content_hash
+            ) AS batch
+            WHERE NOT EXISTS (
+                SELECT 1 FROM raw_studies r WHERE r.content_hash = batch.content_hash
+            )
+            """,
+            [source, nct_ids, payloads, hashes],
+        ).fetchone()
+        return result[0] if result else 0
+
     def get_study_by_nct_id(self, nct_id: str) -> list[dict[str, Any]]:
         """Get all versions of a study by NCT ID.
 
         Returns:
             List of study records (may have multiple versions)
         """
+        return self.get_studies_by_nct_ids([nct_id]).get(nct_id, [])
+
+    def get_studies_by_nct_ids(self, nct_ids: Sequence[str]) -> dict[str, list[dict[str, Any]]]:
+        """Get all versions of several studies with a single query.
+
+        The ids are bound as one list parameter, so any number of them
+        costs one round trip.
+
+        Returns:
+            Mapping of NCT ID to its records, newest first; ids without
+            records are omitted
+        """
+        if not nct_ids:
+            return {}
+
         result = self.db.connection.execute(
             """
             SELECT id, nct_id, source, raw_json, content_hash, ingested_at
             FROM raw_studies
-            WHERE nct_id = ?
-            ORDER BY ingested_at DESC
+            WHERE nct_id IN (SELECT unnest(?::VARCHAR[]))
+            ORDER BY nct_id, ingested_at DESC, id DESC
             """,
-            [nct_id],
+            [list(nct_ids)],
         ).fetchall()
 
-        return [
-            {
-                "id": row[0],
-                "nct_id": row[1],
-                "source": row[2],
-                "raw_json": json.loads(row[3]),
-                "content_hash": row[4],
-                "ingested_at": row[5],
-            }
-            for row in result
-        ]
+        studies: dict[str, list[dict[str, Any]]] = {}
+        for row in result:
+            studies.setdefault(row[1], []).append(
+                {
+                    "id": row[0],
+                    "nct_id": row[1],
+                    "source": row[2],
+                    "raw_json": orjson.loads(row[3]),
+                    "content_hash": row[4],
+                    "ingested_at": row[5],
+                }
+            )
+        return studies
 
     def get_latest_study(self, nct_id: str) -> dict[str, Any] | None:
         """Get the most recent version of a study."""
         studies = self.get_study_by_nct_id(nct_id)
         return studies[0] if studies else None
 
+    def max_id(self) -> int:
+        """Highest raw record id (0 if empty); later inserts get larger ids."""
+        result = self.db.connection.execute("SELECT COALESCE(MAX(id), 0) FROM raw_studies").fetchone()
+        return result[0] if result else 0
+
+    def export_parquet(self, path: Path, after_id: int = 0) -> int:
+        """Write raw records with id > after_id to a ZSTD-compressed Parquet file.
+
+        Args:
+            path: Output file (parent directories are created)
+            after_id: Export only records inserted after this id
+
+        Returns:
+            Number of exported records
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        target = str(path).replace("'", "''")
+
+        result = self.db.connection.execute(
+            f"""
+            COPY (
+                SELECT id, nct_id, source, raw_json, content_hash, ingested_at
+                FROM raw_studies
+                WHERE id > ?
+                ORDER BY id
+            ) TO '{target}' (FORMAT PARQUET, COMPRESSION ZSTD)
+            """,
+            [after_id],
+        ).fetchone()
+        exported = result[0] if result else 0
+
+        logger.info("Exported %d raw studies to %s", exported, path)
+        return exported
+
     def count_studies(self) -> int:
         """Count total raw study records."""
         result = self.db.connection.execute("SELECT COUNT(*) FROM raw_studies").fetchone()
@@ -0,0 +1,33 @@
+"""Analytics (gold layer) query validation."""
+
+from pathlib import Path
+
+from clinical_trial_pipeline.common.logging import get_logger
+from clinical_trial_pipeline.storage.database import Database
+
+logger = get_logger(__name__)
+
+ANALYTICS_SQL_DIR = Path(__file__).parent.parent.parent.parent / "sql" / "analytics"
+
+
+def validate_analytics(db: Database, sql_dir: Path = ANALYTICS_SQL_DIR) -> dict[str, int]:
+    """Execute each analytics query to check the gold layer is queryable.
+
+    Args:
+        db: Database with materialized staging tables
+        sql_dir: Directory containing analytics SQL files
+
+    Returns:
+        Row count per SQL file name
+    """
+    row_counts = {}
+
+    for sql_file in sorted(sql_dir.glob("*.sql")):
+        rows = db.connection.execute(sql_file.read_text()).fetchall()
+        row_counts[sql_file.name] = len(rows)
+
+        if not rows:
+            logger.warning("Analytics query %s returned no data", sql_file.name)
+
+    logger.info("Analytics validation complete: %d queries", len(row_counts))
+    return row_counts
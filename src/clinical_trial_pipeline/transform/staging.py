@@ -0,0 +1,60 @@
+"""Staging (silver layer) materialization."""
+
+from pathlib import Path
+
+import duckdb
+
+from clinical_trial_pipeline.common.logging import get_logger
+from clinical_trial_pipeline.storage.database import Database
+
+logger = get_logger(__name__)
+
+STAGING_SQL_DIR = Path(__file__).parent.parent.parent.parent / "sql" / "staging"
+
+
+def _drop_legacy_views(db: Database) -> None:
+    """Drop staging views left by earlier versions (DuckDB cannot replace a view with a table)."""
+    views = db.connection.execute(
+        "SELECT view_name FROM duckdb_views() WHERE NOT internal AND starts_with(view_name, 'stg_')"
+    ).fetchall()
+
+    for (view_name,) in views:
+        db.connection.execute(f'DROP VIEW "{view_name}"')
+        logger.info("Dropped legacy staging view %s", view_name)
+
+
+def apply_staging(db: Database, sql_dir: Path = STAGING_SQL_DIR) -> list[str]:
+    """Materialize staging tables from raw studies.
+
+    Each SQL file is a `CREATE OR REPLACE TABLE ... AS SELECT`, so running
+    this after every ingestion keeps staging in sync with the raw layer.
+
+    Args:
+        db: Database to materialize staging tables in
+        sql_dir: Directory containing staging SQL files (applied in name order)
+
+    Returns:
+        Names of the applied SQL files
+    """
+    applied = []
+
+    # One transaction for the whole refresh: staging tables are swapped in
+    # together, and a failing file leaves the previous tables (or, on a legacy
+    # database, the previous views) untouched
+    db.connection.execute("BEGIN TRANSACTION")
+    try:
+        _drop_legacy_views(db)
+        for sql_file in sorted(sql_dir.glob("*.sql")):
+            logger.debug("Applying staging file %s", sql_file.name)
+            try:
+                db.connection.execute(sql_file.read_text())
+            except duckdb.Error as e:
+                raise type(e)(f"Staging file {sql_file.name} failed: {e}") from e
+            applied.append(sql_file.name)
+    except BaseException:
+        db.connection.execute("ROLLBACK")
+        raise
+    db.connection.execute("COMMIT")
+
+    logger.info("Staging tables materialized: %d files applied", len(applied))
+    return applied
@@ -0,0 +1,69 @@
+"""Tests for analytics query validation."""
+
+import pytest
+
+from clinical_trial_pipeline.storage.database import Database
+from clinical_trial_pipeline.storage.raw_repository import RawStudyRepository
+from clinical_trial_pipeline.transform.analytics import ANALYTICS_SQL_DIR, validate_analytics
+from clinical_trial_pipeline.transform.staging import apply_staging
+
+
+class TestValidateAnalytics:
+    """Tests for validate_analytics."""
+
+    @pytest.fixture
+    def db(self):
+        """Create an in-memory database with staging tables."""
+        db = Database(":memory:")
+        db.connect()
+        repo = RawStudyRepository(db)
+        repo.initialize()
+        repo.insert_study(
+            "NCT001",
+            {
+                "protocolSection": {
+                    "identificationModule": {"nctId": "NCT001"},
+                    "conditionsModule": {"conditions": ["Asthma"]},
+                }
+            },
+        )
+        apply_staging(db)
+        yield db
+        db.close()
+
+    def test_runs_every_query(self, db):
+        row_counts = validate_analytics(db)
+
+        assert sorted(row_counts) == [
+            "interventions_completion_rate.sql",
+            "study_duration.sql",
+            "top_conditions.sql",
+            "trials_by_country.sql",
+            "trials_by_phase.sql",
+        ]
+
+    def test_reports_row_counts(self, db):
+        row_counts = validate_analytics(db)
+
+        assert row_counts["top_conditions.sql"] == 1
+        assert row_counts["trials_by_country.sql"] == 0
+
+    def test_duration_label_for_missing_study_type(self, db):
+        RawStudyRepository(db).insert_study(
+            "NCT002",
+            {
+                "protocolSection": {
+                    "identificationModule": {"nctId": "NCT002"},
+                    "statusModule": {
+                        "startDateStruct": {"date": "2020-01-01"},
+                        "primaryCompletionDateStruct": {"date": "2021-01-01"},
+                    },
+                }
+            },
+        )
+        apply_staging(db)
+
+        query = (ANALYTICS_SQL_DIR / "study_duration.sql").read_text()
+        rows = db.connection.execute(query).fetchall()
+
+        assert [(row[2], row[4]) for row in rows] == [("Unknown / Unknown", 12.0)]
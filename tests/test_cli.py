@@ -0,0 +1,19 @@
+"""Tests for the CLI entrypoint."""
+
+import sys
+
+from clinical_trial_pipeline.cli import main
+
+
+class TestValidateCommand:
+    """Tests for the validate command."""
+
+    def test_missing_database_fails_cleanly(self, monkeypatch, tmp_path, caplog):
+        # Keep the package logger's handlers and level untouched for later tests
+        monkeypatch.setattr("clinical_trial_pipeline.cli.setup_logging", lambda: None)
+        db_path = tmp_path / "missing.duckdb"
+        monkeypatch.setattr(sys, "argv", ["clinical_trial_pipeline", "validate", "--db-path", str(db_path)])
+
+        assert main() == 1
+        assert "Database not found" in caplog.text
+        assert not db_path.exists()
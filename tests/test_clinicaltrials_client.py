@@ -1,9 +1,17 @@
 """Tests for ClinicalTrials.gov API client."""
 
+import io
+
+import orjson
 import pytest
 import requests
+from urllib3 import HTTPResponse
+from urllib3.exceptions import ReadTimeoutError
 
 from clinical_trial_pipeline.extract.clinicaltrials_client import (
+    MAX_BACKOFF,
+    MAX_RETRY_AFTER,
+    READ_RETRIES,
     APIConfig,
     ClinicalTrialsAPIError,
     ClinicalTrialsClient,
@@ -17,7 +25,8 @@ class TestAPIConfig:
         config = APIConfig()
         assert config.base_url == "https://clinicaltrials.gov/api/v2"
         assert config.timeout == 30
-        assert config.page_size == 100
+        assert config.page_size == 1000
+        assert config.max_retries == 3
 
     def test_custom_values(self):
         config = APIConfig(base_url="http://test.com", timeout=10, page_size=50)
@@ -25,16 +34,67 @@ class TestAPIConfig:
         assert config.timeout == 10
         assert config.page_size == 50
 
+    @pytest.mark.parametrize("page_size", [0, 1001])
+    def test_page_size_outside_api_limits_rejected(self, page_size):
+        with pytest.raises(ValueError, match="page_size"):
+            APIConfig(page_size=page_size)
+
 
 class TestClinicalTrialsClient:
     """Tests for ClinicalTrialsClient."""
 
+    def test_session_retries_rate_limited_requests(self):
+        with ClinicalTrialsClient(APIConfig(max_retries=5)) as client:
+            retry = client._session.get_adapter("https://clinicaltrials.gov/api/v2").max_retries
+
+        assert retry.total == 5
+        assert 429 in retry.status_forcelist
+        assert retry.respect_retry_after_header
+        assert retry.backoff_max == MAX_BACKOFF
+        assert retry.parse_retry_after("3600") == MAX_RETRY_AFTER
+
+    def test_read_timeout_retried_once_then_reported_as_timeout(self, mocker):
+        make_request = mocker.patch(
+            "urllib3.connectionpool.HTTPConnectionPool._make_request",
+            side_effect=ReadTimeoutError(None, "/studies", "Read timed out."),
+        )
+
+        with ClinicalTrialsClient(APIConfig(base_url="http://127.0.0.1:9", timeout=1)) as client:
+            with pytest.raises(ClinicalTrialsAPIError, match="timed out after 1s"):
+                client.fetch_studies()
+
+        assert make_request.call_count == 1 + READ_RETRIES
+
+    def test_single_read_timeout_recovered(self, mocker):
+        response = HTTPResponse(
+            body=io.BytesIO(orjson.dumps({"studies": [{"nctId": "NCT001"}]})),
+            status=200,
+            preload_content=False,
+        )
+        make_request = mocker.patch(
+            "urllib3.connectionpool.HTTPConnectionPool._make_request",
+            side_effect=[ReadTimeoutError(None, "/studies", "Read timed out."), response],
+        )
+
+        with ClinicalTrialsClient(APIConfig(base_url="http://127.0.0.1:9", timeout=1)) as client:
+            data = client.fetch_studies()
+
+        assert data["studies"] == [{"nctId": "NCT001"}]
+        assert make_request.call_count == 2
+
+    def test_session_accepts_compressed_responses(self):
+        with ClinicalTrialsClient() as client:
+            accept_encoding = client._session.headers["Accept-Encoding"]
+
+        assert "gzip" in accept_encoding
+        assert "br" in accept_encoding
+
     def test_fetch_studies_success(self, mocker):
         mock_response = mocker.Mock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "studies": [{"protocolSection": {"identificationModule": {"nctId": "NCT001"}}}],
             "nextPageToken": "token123",
-        }
+        })
         mock_response.raise_for_status = mocker.Mock()
 
         mock_session = mocker.patch("requests.Session")
@@ -49,7 +109,7 @@ class TestClinicalTrialsClient:
 
     def test_fetch_studies_with_page_token(self, mocker):
         mock_response = mocker.Mock()
-        mock_response.json.return_value = {"studies": [], "nextPageToken": None}
+        mock_response.content = orjson.dumps({"studies": [], "nextPageToken": None})
         mock_response.raise_for_status = mocker.Mock()
 
         mock_session = mocker.patch("requests.Session")
@@ -62,6 +122,21 @@ class TestClinicalTrialsClient:
         assert call_kwargs.kwargs["params"]["pageToken"] == "abc123"
         assert call_kwargs.kwargs["params"]["pageSize"] == 50
 
+    def test_fetch_studies_reuses_one_session(self, mocker):
+        mock_response = mocker.Mock()
+        mock_response.content = orjson.dumps({"studies": [], "nextPageToken": None})
+        mock_response.raise_for_status = mocker.Mock()
+
+        mock_session = mocker.patch("requests.Session")
+        mock_session.return_value.get.return_value = mock_response
+
+        with ClinicalTrialsClient() as client:
+            for token in (None, "page2", "page3"):
+                client.fetch_studies(page_token=token)
+
+        mock_session.assert_called_once()
+        assert mock_session.return_value.get.call_count == 3
+
     def test_fetch_studies_timeout_error(self, mocker):
         mock_session = mocker.patch("requests.Session")
         mock_session.return_value.get.side_effect = requests.exceptions.Timeout()
@@ -99,6 +174,20 @@ class TestClinicalTrialsClient:
 
         assert "500" in str(exc_info.value)
 
+    def test_fetch_studies_invalid_json(self, mocker):
+        mock_response = mocker.Mock()
+        mock_response.content = b"<html>Service Unavailable</html>"
+        mock_response.raise_for_status = mocker.Mock()
+
+        mock_session = mocker.patch("requests.Session")
+        mock_session.return_value.get.return_value = mock_response
+
+        with ClinicalTrialsClient() as client:
+            with pytest.raises(ClinicalTrialsAPIError) as exc_info:
+                client.fetch_studies()
+
+        assert "invalid JSON" in str(exc_info.value)
+
     def test_context_manager(self, mocker):
         mock_session = mocker.patch("requests.Session")
 
@@ -109,7 +198,7 @@ class TestClinicalTrialsClient:
 
     def test_custom_config(self, mocker):
         mock_response = mocker.Mock()
-        mock_response.json.return_value = {"studies": []}
+        mock_response.content = orjson.dumps({"studies": []})
         mock_response.raise_for_status = mocker.Mock()
 
         mock_session = mocker.patch("requests.Session")
@@ -1,9 +1,13 @@
 """Tests for ingestion service."""
 
+import threading
+from datetime import datetime
+
 import pytest
 
 from clinical_trial_pipeline.load.ingestion import IngestResult, IngestService
 from clinical_trial_pipeline.extract.clinicaltrials_client import ClinicalTrialsAPIError
+from clinical_trial_pipeline.storage.database import Database
 
 
 class TestIngestResult:
@@ -233,6 +237,7 @@ class TestIngestService:
 
         assert result.pages == 0
         assert result.inserted == 0
+        mock_repo.insert_studies_batch.assert_not_called()
 
     def test_run_with_skipped_duplicates(self, mocker):
         mock_db = mocker.MagicMock()
@@ -268,3 +273,208 @@ class TestIngestService:
         assert result.inserted == 2
         assert result.skipped == 3
         assert result.total_processed == 5
+
+    def test_run_prefetches_next_page_before_insert(self, mocker):
+        mock_db = mocker.MagicMock()
+        mock_db.__enter__ = mocker.Mock(return_value=mock_db)
+        mock_db.__exit__ = mocker.Mock(return_value=False)
+        mocker.patch(
+            "clinical_trial_pipeline.load.ingestion.Database",
+            return_value=mock_db,
+        )
+
+        second_page_requested = threading.Event()
+        prefetched = []
+        pages = iter([
+            {"studies": [{"nctId": "NCT001"}], "nextPageToken": "token1"},
+            {"studies": [{"nctId": "NCT002"}], "nextPageToken": None},
+        ])
+
+        def fetch_studies(page_token=None, page_size=None):
+            if page_token == "token1":
+                second_page_requested.set()
+            return next(pages)
+
+        def insert_studies_batch(studies):
+            if studies[0]["nctId"] == "NCT001":
+                # Page 2 must be in flight while page 1 is written
+                prefetched.append(second_page_requested.wait(timeout=5))
+            return (1, 0)
+
+        mock_repo = mocker.MagicMock()
+        mock_repo.insert_studies_batch.side_effect = insert_studies_batch
+        mocker.patch(
+            "clinical_trial_pipeline.load.ingestion.RawStudyRepository",
+            return_value=mock_repo,
+        )
+
+        mock_client = mocker.MagicMock()
+        mock_client.__enter__ = mocker.Mock(return_value=mock_client)
+        mock_client.__exit__ = mocker.Mock(return_value=False)
+        mock_client.fetch_studies.side_effect = fetch_studies
+        mocker.patch(
+            "clinical_trial_pipeline.load.ingestion.ClinicalTrialsClient",
+            return_value=mock_client,
+        )
+
+        service = IngestService(db_path=":memory:")
+        result = service.run()
+
+        assert result.pages == 2
+        assert prefetched == [True]
+
+    def test_run_last_page_requests_only_remaining_studies(self, mocker):
+        mock_db = mocker.MagicMock()
+        mock_db.__enter__ = mocker.Mock(return_value=mock_db)
+        mock_db.__exit__ = mocker.Mock(return_value=False)
+        mocker.patch(
+            "clinical_trial_pipeline.load.ingestion.Database",
+            return_value=mock_db,
+        )
+
+        mock_repo = mocker.MagicMock()
+        mock_repo.insert_studies_batch.side_effect = lambda studies: (len(studies), 0)
+        mocker.patch(
+            "clinical_trial_pipeline.load.ingestion.RawStudyRepository",
+            return_value=mock_repo,
+        )
+
+        mock_client = mocker.MagicMock()
+        mock_client.__enter__ = mocker.Mock(return_value=mock_client)
+        mock_client.__exit__ = mocker.Mock(return_value=False)
+        mock_client.fetch_studies.side_effect = [
+            {"studies": [{"nctId": f"NCT{i}"} for i in range(4)], "nextPageToken": "token1"},
+            {"studies": [{"nctId": f"NCT{i}"} for i in range(4, 6)], "nextPageToken": "token2"},
+        ]
+        client_cls = mocker.patch(
+            "clinical_trial_pipeline.load.ingestion.ClinicalTrialsClient",
+            return_value=mock_client,
+        )
+
+        service = IngestService(db_path=":memory:", page_size=4)
+        result = service.run(max_studies=6)
+
+        assert result.total_processed == 6
+        assert client_cls.call_args.args[0].page_size == 4
+        assert mock_client.fetch_studies.call_count == 2
+        assert mock_client.fetch_studies.call_args_list[1].kwargs["page_size"] == 2
+
+    def test_page_size_outside_api_limits_rejected(self):
+        with pytest.raises(ValueError, match="page_size"):
+            IngestService(db_path=":memory:", page_size=5000)
+
+    def test_run_zero_max_pages_fetches_nothing(self, mocker):
+        mock_db = mocker.MagicMock()
+        mock_db.__enter__ = mocker.Mock(return_value=mock_db)
+        mock_db.__exit__ = mocker.Mock(return_value=False)
+        mocker.patch(
+            "clinical_trial_pipeline.load.ingestion.Database",
+            return_value=mock_db,
+        )
+        mocker.patch("clinical_trial_pipeline.load.ingestion.RawStudyRepository")
+
+        mock_client = mocker.MagicMock()
+        mock_client.__enter__ = mocker.Mock(return_value=mock_client)
+        mock_client.__exit__ = mocker.Mock(return_value=False)
+        mocker.patch(
+            "clinical_trial_pipeline.load.ingestion.ClinicalTrialsClient",
+            return_value=mock_client,
+        )
+
+        service = IngestService(db_path=":memory:")
+        result = service.run(max_pages=0)
+
+        assert result.pages == 0
+        mock_client.fetch_studies.assert_not_called()
+
+    def test_run_exports_new_rows_to_parquet(self, mocker, tmp_path):
+        mock_db = mocker.MagicMock()
+        mock_db.__enter__ = mocker.Mock(return_value=mock_db)
+        mock_db.__exit__ = mocker.Mock(return_value=False)
+        mocker.patch(
+            "clinical_trial_pipeline.load.ingestion.Database",
+            return_value=mock_db,
+        )
+
+        mock_repo = mocker.MagicMock()
+        mock_repo.max_id.return_value = 41
+        mock_repo.insert_studies_batch.return_value = (1, 0)
+        mocker.patch(
+            "clinical_trial_pipeline.load.ingestion.RawStudyRepository",
+            return_value=mock_repo,
+        )
+
+        mock_client = mocker.MagicMock()
+        mock_client.__enter__ = mocker.Mock(return_value=mock_client)
+        mock_client.__exit__ = mocker.Mock(return_value=False)
+        mock_client.fetch_studies.return_value = {
+            "studies": [{"protocolSection": {"identificationModule": {"nctId": "NCT001"}}}],
+            "nextPageToken": None,
+        }
+        mocker.patch(
+            "clinical_trial_pipeline.load.ingestion.ClinicalTrialsClient",
+            return_value=mock_client,
+        )
+
+        service = IngestService(db_path=":memory:", parquet_dir=tmp_path)
+        result = service.run()
+
+        assert result.parquet_path.parent.parent == tmp_path
+        assert result.parquet_path.parent.name.startswith("ingest_date=")
+        mock_repo.export_parquet.assert_called_once_with(result.parquet_path, after_id=41)
+
+    def test_parquet_exports_in_same_second_do_not_overwrite(self, mocker, tmp_path):
+        mock_datetime = mocker.patch("clinical_trial_pipeline.load.ingestion.datetime")
+        mock_datetime.now.return_value = datetime(2026, 1, 2, 3, 4, 5)
+
+        mock_client = mocker.MagicMock()
+        mock_client.__enter__ = mocker.Mock(return_value=mock_client)
+        mock_client.__exit__ = mocker.Mock(return_value=False)
+        mock_client.fetch_studies.side_effect = [
+            {"studies": [{"protocolSection": {"identificationModule": {"nctId": nct_id}}}]}
+            for nct_id in ("NCT001", "NCT002")
+        ]
+        mocker.patch(
+            "clinical_trial_pipeline.load.ingestion.ClinicalTrialsClient",
+            return_value=mock_client,
+        )
+
+        service = IngestService(db_path=":memory:", parquet_dir=tmp_path)
+        with Database(":memory:") as db:
+            first = service.run(database=db)
+            second = service.run(database=db)
+
+            assert first.parquet_path != second.parquet_path
+            for result in (first, second):
+                assert db.connection.execute(
+                    "SELECT COUNT(*) FROM read_parquet(?)", [str(result.parquet_path)]
+                ).fetchone()[0] == 1
+
+    def test_run_uses_given_database_without_closing_it(self, mocker):
+        database_cls = mocker.patch("clinical_trial_pipeline.load.ingestion.Database")
+        mock_repo = mocker.MagicMock()
+        mock_repo.insert_studies_batch.return_value = (1, 0)
+        repo_cls = mocker.patch(
+            "clinical_trial_pipeline.load.ingestion.RawStudyRepository",
+            return_value=mock_repo,
+        )
+
+        mock_client = mocker.MagicMock()
+        mock_client.__enter__ = mocker.Mock(return_value=mock_client)
+        mock_client.__exit__ = mocker.Mock(return_value=False)
+        mock_client.fetch_studies.return_value = {
+            "studies": [{"protocolSection": {"identificationModule": {"nctId": "NCT001"}}}],
+            "nextPageToken": None,
+        }
+        mocker.patch(
+            "clinical_trial_pipeline.load.ingestion.ClinicalTrialsClient",
+            return_value=mock_client,
+        )
+        database = mocker.MagicMock()
+
+        result = IngestService(db_path=":memory:").run(database=database)
+
+        assert result.inserted == 1
+        database_cls.assert_not_called()
+        repo_cls.assert_called_once_with(database)
+        database.close.assert_not_called()
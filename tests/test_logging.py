@@ -0,0 +1,53 @@
+"""Tests for logging configuration."""
+
+import logging
+import sys
+import threading
+
+import pytest
+
+from clinical_trial_pipeline.common import logging as pipeline_logging
+
+
+@pytest.fixture
+def package_logger(monkeypatch):
+    """Reset the configured flag; restore the logger's handlers and level afterwards."""
+    logger = logging.getLogger("clinical_trial_pipeline")
+    original_handlers = list(logger.handlers)
+    original_level = logger.level
+    monkeypatch.setattr(pipeline_logging, "_configured", False)
+    yield logger
+    logger.handlers = original_handlers
+    logger.setLevel(original_level)
+
+
+def stdout_handlers(logger: logging.Logger) -> list[logging.Handler]:
+    return [
+        h for h in logger.handlers
+        if isinstance(h, logging.StreamHandler) and h.stream is sys.stdout
+    ]
+
+
+class TestSetupLogging:
+    """Tests for setup_logging."""
+
+    def test_concurrent_calls_add_one_handler(self, package_logger):
+        package_logger.handlers = []
+        threads = [threading.Thread(target=pipeline_logging.setup_logging) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(stdout_handlers(package_logger)) == 1
+
+    def test_reuses_existing_handler_after_reset(self, package_logger):
+        package_logger.handlers = []
+        pipeline_logging.setup_logging()
+
+        # Simulates a module re-import (e.g. Streamlit reruns)
+        pipeline_logging._configured = False
+        pipeline_logging.setup_logging()
+
+        assert len(stdout_handlers(package_logger)) == 1
@@ -0,0 +1,126 @@
+"""Tests for staging layer materialization."""
+
+import duckdb
+import pytest
+
+from clinical_trial_pipeline.storage.database import Database
+from clinical_trial_pipeline.storage.raw_repository import RawStudyRepository
+from clinical_trial_pipeline.transform.staging import apply_staging
+
+
+def table_type(db: Database, name: str) -> str | None:
+    result = db.connection.execute(
+        "SELECT table_type FROM information_schema.tables WHERE table_name = ?",
+        [name],
+    ).fetchone()
+    return result[0] if result else None
+
+
+class TestApplyStaging:
+    """Tests for apply_staging."""
+
+    @pytest.fixture
+    def db(self):
+        """Create an in-memory database with a few raw studies."""
+        db = Database(":memory:")
+        db.connect()
+        repo = RawStudyRepository(db)
+        repo.initialize()
+        repo.insert_studies_batch(
+            [
+                {
+                    "protocolSection": {
+                        "identificationModule": {"nctId": "NCT001"},
+                        "statusModule": {"overallStatus": "COMPLETED"},
+                        "conditionsModule": {"conditions": ["Asthma", "COPD"]},
+                    }
+                },
+                {
+                    "protocolSection": {
+                        "identificationModule": {"nctId": "NCT002"},
+                        "statusModule": {"overallStatus": "RECRUITING"},
+                    }
+                },
+            ]
+        )
+        yield db
+        db.close()
+
+    def test_creates_staging_tables(self, db):
+        applied = apply_staging(db)
+
+        assert applied == [
+            "001_stg_studies.sql",
+            "002_stg_conditions.sql",
+            "003_stg_interventions.sql",
+            "004_stg_locations.sql",
+            "005_stg_summary.sql",
+        ]
+        for name in ("stg_studies", "stg_conditions", "stg_interventions", "stg_locations", "stg_summary"):
+            assert table_type(db, name) == "BASE TABLE"
+
+    def test_tables_contain_raw_data(self, db):
+        apply_staging(db)
+
+        assert db.connection.execute("SELECT COUNT(*) FROM stg_studies").fetchone()[0] == 2
+        assert db.connection.execute("SELECT COUNT(*) FROM stg_conditions").fetchone()[0] == 2
+
+    def test_summary_counts(self, db):
+        apply_staging(db)
+
+        summary = db.connection.execute(
+            "SELECT total_studies, completed_studies, total_conditions FROM stg_summary"
+        ).fetchall()
+        assert summary == [(2, 1, 2)]
+
+    def test_reapply_refreshes_tables(self, db):
+        apply_staging(db)
+        RawStudyRepository(db).insert_study(
+            "NCT003", {"protocolSection": {"identificationModule": {"nctId": "NCT003"}}}
+        )
+
+        apply_staging(db)
+
+        assert db.connection.execute("SELECT COUNT(*) FROM stg_studies").fetchone()[0] == 3
+
+    def test_applies_files_without_trailing_semicolon(self, db, tmp_path):
+        (tmp_path / "001_a.sql").write_text("CREATE OR REPLACE TABLE stg_a AS SELECT 1 AS x")
+        (tmp_path / "002_b.sql").write_text("CREATE OR REPLACE TABLE stg_b AS SELECT x + 1 AS y FROM stg_a;\n")
+
+        applied = apply_staging(db, sql_dir=tmp_path)
+
+        assert applied == ["001_a.sql", "002_b.sql"]
+        assert db.connection.execute("SELECT y FROM stg_b").fetchone()[0] == 2
+
+    def test_applies_files_ending_in_comment(self, db, tmp_path):
+        (tmp_path / "001_a.sql").write_text("CREATE OR REPLACE TABLE stg_a AS SELECT 1 AS x -- no newline")
+        (tmp_path / "002_b.sql").write_text("CREATE OR REPLACE TABLE stg_b AS SELECT x + 1 AS y FROM stg_a")
+
+        apply_staging(db, sql_dir=tmp_path)
+
+        assert db.connection.execute("SELECT y FROM stg_b").fetchone()[0] == 2
+
+    def test_error_names_failing_file_and_rolls_back(self, db, tmp_path):
+        (tmp_path / "001_a.sql").write_text("CREATE OR REPLACE TABLE stg_a AS SELECT 1 AS x")
+        (tmp_path / "002_b.sql").write_text("CREATE OR REPLACE TABLE stg_b AS SELEC 1")
+
+        with pytest.raises(duckdb.Error, match="002_b.sql"):
+            apply_staging(db, sql_dir=tmp_path)
+
+        assert table_type(db, "stg_a") is None
+
+    def test_replaces_legacy_views(self, db):
+        db.connection.execute("CREATE VIEW stg_studies AS SELECT nct_id FROM raw_studies")
+
+        apply_staging(db)
+
+        assert table_type(db, "stg_studies") == "BASE TABLE"
+
+    def test_failed_refresh_keeps_legacy_views(self, db, tmp_path):
+        db.connection.execute("CREATE VIEW stg_studies AS SELECT nct_id FROM raw_studies")
+        (tmp_path / "001_stg_studies.sql").write_text("CREATE OR REPLACE TABLE stg_studies AS SELEC 1")
+
+        with pytest.raises(duckdb.Error):
+            apply_staging(db, sql_dir=tmp_path)
+
+        assert table_type(db, "stg_studies") == "VIEW"
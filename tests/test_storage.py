@@ -1,13 +1,26 @@
 """Tests for storage layer."""
 
+import json
+
+import duckdb
 import pytest
 
+from clinical_trial_pipeline.storage import raw_repository
 from clinical_trial_pipeline.storage.database import Database
 from clinical_trial_pipeline.storage.raw_repository import (
     RawStudyRepository,
+    canonical_json,
     compute_content_hash,
 )
 
+BYTE_UNITS = {"B": 1, "KB": 1e3, "MB": 1e6, "GB": 1e9, "KiB": 2**10, "MiB": 2**20, "GiB": 2**30}
+
+
+def parse_bytes(value: str) -> float:
+    """Parse a DuckDB size setting such as '953.6 MiB' into bytes."""
+    number, unit = value.split()
+    return float(number) * BYTE_UNITS[unit]
+
 
 class TestComputeContentHash:
     """Tests for content hash computation."""
@@ -27,6 +40,65 @@ class TestComputeContentHash:
         data2 = {"b": 2, "a": 1}
         assert compute_content_hash(data1) == compute_content_hash(data2)
 
+    def test_hash_matches_stored_format(self):
+        # Stored hashes are SHA-256 of compact, key-sorted, ASCII-escaped JSON;
+        # changing that would break dedup against rows already in raw_studies
+        data = {"nctId": "NCT001", "title": "Zürich étude", "n": [1, 2.5, None, True]}
+        assert compute_content_hash(data) == (
+            "5066b13f2da8afc0fa5dbd8117a2960d786ab15f8421e36730efb879106d2e7c"
+        )
+
+
+class TestCanonicalJson:
+    """Tests for canonical JSON serialization."""
+
+    @pytest.fixture
+    def repo_with_study(self):
+        """Create a repository holding one study with non-ASCII text."""
+        db = Database(":memory:")
+        db.connect()
+        repo = RawStudyRepository(db)
+        repo.initialize()
+        raw_json = {"protocolSection": {"identificationModule": {"nctId": "NCT001"}}, "city": "São Paulo"}
+        repo.insert_study("NCT001", raw_json)
+        yield repo, raw_json
+        db.close()
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"b": [1, 2.5, None, True], "a": {"z": "x", "y": -0.0}},
+            {"title": "Zürich ≥ 5 µg", "emoji": "😀 𝔘", "del": "\x7f", "ctrl": "\n\t\x00"},
+            {"tiny": [1e-05, 1.5e-07, 3e-10, 0.0001], "big": [1e16, 1.2e300]},
+            {"huge_int": 2**70, "neg": -(2**63)},
+            {"quote": 'say "hi" \\ \\u0041 é'},
+            {"lone_surrogate": "\ud800"},
+            {"nan": float("nan"), "inf": [float("inf"), -float("inf")], "none": None},
+        ],
+    )
+    def test_matches_stdlib_json(self, data):
+        expected = json.dumps(data, sort_keys=True, separators=(",", ":"))
+        assert canonical_json(data) == expected
+
+    def test_hyphenated_text_takes_orjson_path(self, monkeypatch):
+        data = {"briefTitle": "Phase-2 Study of Type-2 Diabetes", "arm": "dose-1", "ratio": 0.5}
+        expected = json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+        def no_fallback(*args, **kwargs):
+            raise AssertionError("fell back to json.dumps")
+
+        monkeypatch.setattr(raw_repository.json, "dumps", no_fallback)
+        assert canonical_json(data) == expected
+
+    def test_hash_is_sha256_of_canonical_json(self, repo_with_study):
+        repo, raw_json = repo_with_study
+        row = repo.db.connection.execute(
+            "SELECT raw_json, content_hash, sha256(raw_json) FROM raw_studies"
+        ).fetchone()
+
+        assert row[0] == canonical_json(raw_json)
+        assert row[1] == row[2]
+
 
 class TestDatabase:
     """Tests for Database connection manager."""
@@ -41,6 +113,32 @@ class TestDatabase:
         with Database(":memory:") as db:
             assert db.connection is not None
 
+    def test_read_only_rejects_writes(self, tmp_path):
+        db_path = tmp_path / "test.duckdb"
+        with Database(db_path) as db:
+            db.connection.execute("CREATE TABLE t (x INTEGER)")
+
+        with Database(db_path, read_only=True) as db:
+            assert db.connection.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+            with pytest.raises(duckdb.InvalidInputException):
+                db.connection.execute("INSERT INTO t VALUES (1)")
+
+    def test_settings_from_config_and_env(self, monkeypatch):
+        monkeypatch.setenv("DUCKDB_THREADS", "2")
+        monkeypatch.setenv("DUCKDB_MEMORY_LIMIT", "")
+
+        with Database(":memory:", config={"memory_limit": "1GB"}) as db:
+            settings = dict(
+                db.connection.execute(
+                    "SELECT name, value FROM duckdb_settings() "
+                    "WHERE name IN ('threads', 'memory_limit', 'preserve_insertion_order')"
+                ).fetchall()
+            )
+
+        assert settings["threads"] == "2"
+        assert parse_bytes(settings["memory_limit"]) == pytest.approx(1e9, rel=1e-3)
+        assert settings["preserve_insertion_order"] == "false"
+
     def test_connection_property_creates_connection(self):
         db = Database(":memory:")
         assert db._connection is None
@@ -110,6 +208,31 @@ class TestRawStudyRepository:
         assert inserted == 1
         assert skipped == 1
 
+    def test_insert_studies_batch_skips_existing(self, repo):
+        studies = [
+            {"protocolSection": {"identificationModule": {"nctId": "NCT001"}}},
+            {"protocolSection": {"identificationModule": {"nctId": "NCT002"}}},
+        ]
+        repo.insert_studies_batch(studies[:1])
+
+        inserted, skipped = repo.insert_studies_batch(studies)
+
+        assert inserted == 1
+        assert skipped == 1
+        assert repo.count_studies() == 2
+
+    def test_insert_studies_batch_skips_duplicates_within_batch(self, repo):
+        study = {"protocolSection": {"identificationModule": {"nctId": "NCT001"}}}
+
+        inserted, skipped = repo.insert_studies_batch([study, dict(study)])
+
+        assert inserted == 1
+        assert skipped == 1
+        assert repo.count_studies() == 1
+
+    def test_insert_studies_batch_empty(self, repo):
+        assert repo.insert_studies_batch([]) == (0, 0)
+
     def test_get_study_by_nct_id(self, repo):
         raw_json = {"data": "test"}
         repo.insert_study("NCT001", raw_json)
@@ -124,6 +247,20 @@ class TestRawStudyRepository:
         results = repo.get_study_by_nct_id("NCT999")
         assert results == []
 
+    def test_get_studies_by_nct_ids(self, repo):
+        repo.insert_study("NCT001", {"version": 1})
+        repo.insert_study("NCT001", {"version": 2})
+        repo.insert_study("NCT002", {"version": 3})
+
+        results = repo.get_studies_by_nct_ids(["NCT001", "NCT002", "NCT999"])
+
+        assert set(results) == {"NCT001", "NCT002"}
+        assert [r["raw_json"]["version"] for r in results["NCT001"]] == [2, 1]
+        assert results["NCT002"][0]["nct_id"] == "NCT002"
+
+    def test_get_studies_by_nct_ids_empty(self, repo):
+        assert repo.get_studies_by_nct_ids([]) == {}
+
     def test_get_latest_study(self, repo):
         repo.insert_study("NCT001", {"version": 1})
         repo.insert_study("NCT001", {"version": 2})
@@ -137,6 +274,27 @@ class TestRawStudyRepository:
         result = repo.get_latest_study("NCT999")
         assert result is None
 
+    def test_max_id(self, repo):
+        assert repo.max_id() == 0
+
+        repo.insert_study("NCT001", {"test": "data"})
+
+        assert repo.max_id() == 1
+
+    def test_export_parquet_after_id(self, repo, tmp_path):
+        repo.insert_study("NCT001", {"id": "NCT001"})
+        last_id = repo.max_id()
+        repo.insert_study("NCT002", {"id": "NCT002"})
+        path = tmp_path / "raw" / "part.parquet"
+
+        exported = repo.export_parquet(path, after_id=last_id)
+
+        assert exported == 1
+        rows = repo.db.connection.execute(
+            "SELECT nct_id FROM read_parquet(?)", [str(path)]
+        ).fetchall()
+        assert rows == [("NCT002",)]
+
     def test_source_is_stored(self, repo):
         repo.insert_study("NCT001", {"data": "test"}, source="custom_source")
 